@@ -14,20 +14,26 @@ This script performs:
 
 Outputs:
   data/df_merged_features.csv  — Aligned monthly time-series with features
+  data/df_reddit_scored.csv    — Per-post VADER scores
+  data/*.parquet               — Dtype-preserving copies of both (pyarrow)
   data/plots/*.png             — All visualizations
 =============================================================================
 """
 
 import os
+import gc
+import re
+import hashlib
 import sys
 import warnings
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 import matplotlib
 matplotlib.use("Agg")  # Non-interactive backend for saving plots
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-import seaborn as sns
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 warnings.filterwarnings("ignore", category=FutureWarning)
@@ -43,6 +49,30 @@ OFFICIAL_CSV = os.path.join(DATA_DIR, "df_official.csv")
 CENSUS_CSV   = os.path.join(DATA_DIR, "df_census_degree_mismatch.csv")
 REDDIT_CSV   = os.path.join(DATA_DIR, "df_reddit_sentiment.csv")
 
+# Census columns used downstream (ACS_Year/Geography are constant metadata)
+CENSUS_COLS  = ["Category", "Count", "Source"]
+
+# VADER scoring is pure-Python and CPU-bound — fan out across cores
+VADER_N_JOBS      = os.cpu_count() or 1
+VADER_CHUNK_SIZE  = 500   # Posts per worker task (also the progress step)
+_VADER            = None  # Lazily-built analyzer, one per process
+_FIGURE           = None  # Shared figure reused by every plot
+
+# Engineered features are percents/scores — float32 precision is plenty
+FEATURE_FLOAT_DTYPE = np.float32
+
+# B15011 rows for ages 25-39, excluding the per-sex "Total:!!<Sex>:!!25..."
+# summary rows — one regex pass instead of a contains/not-contains pair
+DEGREE_25_39_PATTERN = re.compile(
+    r"^(?!.*Total:!!(?:Male|Female):!!25).*25 to 39 years"
+)
+
+# Top-level industry rows in C24030 (Total:!!Male:!!IndustryName pattern)
+INDUSTRY_TOP_PATTERN = re.compile(r"^Total:!!(Male|Female):!![A-Z]")
+
+# Collect freed figure memory after every N plots (not after every one)
+GC_EVERY_N_PLOTS  = 2
+
 # Plot styling — dark theme, premium feel
 plt.rcParams.update({
     "figure.facecolor":  "#0d1117",
@@ -57,13 +87,14 @@ plt.rcParams.update({
     "grid.alpha":        0.5,
     "legend.facecolor":  "#161b22",
     "legend.edgecolor":  "#30363d",
+    "legend.loc":        "upper right",  # Never fall back to the "best" search
     "font.family":       "sans-serif",
     "font.size":         11,
     "axes.titlesize":    14,
     "axes.labelsize":    12,
     "figure.dpi":        150,
     "savefig.dpi":       150,
-    "savefig.bbox":      "tight",
+    "savefig.bbox":      "standard",  # Fixed per-plot margins, no layout pass
     "savefig.facecolor": "#0d1117",
 })
 
@@ -81,6 +112,97 @@ COLORS = {
 }
 
 
+def read_csv_fast(path, **kwargs):
+    """
+    Read a CSV with the multithreaded pyarrow parser, falling back to the
+    default C engine when pyarrow is missing or rejects an option.
+    """
+    try:
+        return pd.read_csv(path, engine="pyarrow", **kwargs)
+    except (ImportError, ValueError):
+        return pd.read_csv(path, **kwargs)
+
+
+def frame_fingerprint(df):
+    """Content hash of a DataFrame (values + column names), index excluded."""
+    digest = hashlib.sha1(
+        pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+    )
+    digest.update("\x1f".join(map(str, df.columns)).encode())
+    return digest.hexdigest()
+
+
+def save_table(df, csv_path, executor=None):
+    """
+    Write df to csv_path plus a zstd Parquet twin alongside it. Parquet
+    round-trips dtypes (timestamps, periods, categories) exactly; it is
+    skipped when pyarrow is not installed. With an executor, the slower CSV
+    write runs in the background — the caller must not mutate df until the
+    returned future is done.
+
+    A content fingerprint is kept in a ``<csv_path>.fp`` sidecar; when it
+    matches and both the CSV and the Parquet twin exist, nothing is
+    rewritten.
+
+    Returns
+    -------
+    (parquet_path or None, Future or None for the CSV write, skipped: bool)
+    """
+    parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+    fp_path = csv_path + ".fp"
+    fingerprint = frame_fingerprint(df)
+    # Skip only if every output is present: a deleted Parquet twin (or CSV)
+    # is rewritten even when the content is unchanged
+    if all(map(os.path.exists, (csv_path, fp_path, parquet_path))):
+        with open(fp_path) as f:
+            if f.read() == fingerprint:
+                return parquet_path, None, True
+
+    def write_csv():
+        df.to_csv(csv_path, index=False)
+        with open(fp_path, "w") as f:  # Only after the CSV is complete
+            f.write(fingerprint)
+
+    if executor is not None:
+        csv_future = executor.submit(write_csv)
+    else:
+        write_csv()
+        csv_future = None
+    try:
+        df.to_parquet(parquet_path, engine="pyarrow",
+                      compression="zstd", index=False)
+    except ImportError:
+        parquet_path = None
+    return parquet_path, csv_future, False
+
+
+def text_lengths(col):
+    """
+    Character length of each string in a text column (NaN where missing),
+    matching ``col.str.len()``. Arrow-backed strings already have a native
+    length kernel; for object columns a typed np.fromiter pass avoids the
+    per-element overhead of the .str accessor.
+    """
+    if col.dtype != object:
+        return col.str.len()
+    lengths = np.fromiter(
+        (len(v) if isinstance(v, str) else -1 for v in col.to_numpy()),
+        dtype=np.int64, count=len(col),
+    )
+    missing = lengths < 0
+    if missing.any():
+        return pd.Series(np.where(missing, np.nan, lengths), index=col.index)
+    return pd.Series(lengths, index=col.index)
+
+
+def downcast_floats(df):
+    """Cast every float64 column to FEATURE_FLOAT_DTYPE (halves the bytes)."""
+    float_cols = df.select_dtypes("float64").columns
+    if len(float_cols):
+        df[float_cols] = df[float_cols].astype(FEATURE_FLOAT_DTYPE)
+    return df
+
+
 # ═════════════════════════════════════════════════════════════════════════════
 # SECTION 1: DATA QUALITY AUDIT (Reddit)
 # ═════════════════════════════════════════════════════════════════════════════
@@ -91,20 +213,28 @@ def audit_reddit_data(df_reddit):
     print("SECTION 1 — Data Quality Audit: Reddit Sentiment Data")
     print("=" * 72)
 
+    # Low-cardinality keys → category, so groupby/value_counts use int codes
+    for col in ("subreddit", "search_term", "term_category"):
+        if col in df_reddit.columns:
+            df_reddit[col] = df_reddit[col].astype("category")
+
     # ── 1.1 Basic Shape & Types ──────────────────────────────────────────
     print("\n📐 Shape & Dtypes:")
     print(f"  Rows: {len(df_reddit):,}  |  Columns: {df_reddit.shape[1]}")
     print(f"  Columns: {list(df_reddit.columns)}")
+    summary = pd.DataFrame({
+        "dtype": df_reddit.dtypes,
+        "nulls": df_reddit.isna().sum(),
+    })
+    summary["pct"] = summary["nulls"] * (100.0 / len(df_reddit))
+
     print(f"\n  Dtypes:")
-    for col in df_reddit.columns:
-        print(f"    {col:<15s}: {df_reddit[col].dtype}")
+    for col, dtype in summary["dtype"].items():
+        print(f"    {col:<15s}: {dtype}")
 
     # ── 1.2 Missing Values ───────────────────────────────────────────────
     print("\n🔍 Missing Values:")
-    nulls = df_reddit.isnull().sum()
-    for col in df_reddit.columns:
-        n = nulls[col]
-        pct = n / len(df_reddit) * 100
+    for col, n, pct in zip(summary.index, summary["nulls"], summary["pct"]):
         status = "✓" if n == 0 else "⚠"
         print(f"  {status} {col:<15s}: {n:>5,} nulls ({pct:.1f}%)")
 
@@ -117,26 +247,28 @@ def audit_reddit_data(df_reddit):
 
     # ── 1.4 Date Range Coverage ──────────────────────────────────────────
     print("\n📅 Date Coverage:")
-    df_reddit["created_utc"] = pd.to_datetime(df_reddit["created_utc"])
     print(f"  Earliest: {df_reddit['created_utc'].min()}")
     print(f"  Latest:   {df_reddit['created_utc'].max()}")
 
     df_reddit["year_month"] = df_reddit["created_utc"].dt.to_period("M")
-    monthly_counts = df_reddit.groupby("year_month").size()
+    # One bincount over the integer month ordinals: a bin for every month
+    # from first to last, so empty bins are exactly the gaps
+    ordinals = df_reddit["year_month"].dropna().array.asi8
+    first_month = ordinals.min()
+    month_bins = np.bincount(ordinals - first_month)
+    covered = month_bins > 0
+    monthly_counts = month_bins[covered]
     print(f"  Months covered: {len(monthly_counts)}")
     print(f"  Posts per month: min={monthly_counts.min()}, "
           f"max={monthly_counts.max()}, "
-          f"median={monthly_counts.median():.0f}")
+          f"median={np.median(monthly_counts):.0f}")
 
     # Check for gaps
-    all_months = pd.period_range(
-        start=df_reddit["created_utc"].min().to_period("M"),
-        end=df_reddit["created_utc"].max().to_period("M"),
-        freq="M"
+    missing_months = pd.PeriodIndex.from_ordinals(
+        first_month + np.flatnonzero(~covered), freq="M"
     )
-    missing_months = set(all_months) - set(monthly_counts.index)
-    if missing_months:
-        print(f"  ⚠ Missing months: {sorted(missing_months)}")
+    if len(missing_months):
+        print(f"  ⚠ Missing months: {list(missing_months)}")
     else:
         print(f"  ✓ No gaps — all months covered.")
 
@@ -145,29 +277,30 @@ def audit_reddit_data(df_reddit):
     empty_body = (df_reddit["selftext"] == "").sum()
     print(f"  Empty selftext: {empty_body:,} ({empty_body/len(df_reddit)*100:.1f}%)")
 
-    df_reddit["text_length"] = df_reddit["selftext"].str.len()
-    non_empty = df_reddit[df_reddit["selftext"] != ""]["text_length"]
+    df_reddit["text_length"] = text_lengths(df_reddit["selftext"])
+    non_empty = df_reddit.loc[(df_reddit["selftext"] != "").to_numpy(),
+                              "text_length"]
     if len(non_empty) > 0:
         print(f"  Body length (non-empty): "
               f"min={non_empty.min()}, median={non_empty.median():.0f}, "
               f"max={non_empty.max()}, mean={non_empty.mean():.0f}")
 
-    title_lengths = df_reddit["title"].str.len()
+    title_lengths = text_lengths(df_reddit["title"])
     print(f"  Title length: min={title_lengths.min()}, "
           f"median={title_lengths.median():.0f}, max={title_lengths.max()}")
 
     # ── 1.6 Score Distribution ───────────────────────────────────────────
     print("\n⭐ Score Distribution:")
     scores = df_reddit["score"]
-    print(f"  Min: {scores.min()}, Q1: {scores.quantile(0.25):.0f}, "
-          f"Median: {scores.median():.0f}, Q3: {scores.quantile(0.75):.0f}, "
+    score_values = scores.to_numpy()
+    q1, q2, q3 = np.quantile(score_values, [0.25, 0.5, 0.75])  # One selection pass
+    print(f"  Min: {scores.min()}, Q1: {q1:.0f}, "
+          f"Median: {q2:.0f}, Q3: {q3:.0f}, "
           f"Max: {scores.max()}")
     print(f"  Mean: {scores.mean():.1f}, Std: {scores.std():.1f}")
 
-    outlier_threshold = scores.quantile(0.75) + 1.5 * (
-        scores.quantile(0.75) - scores.quantile(0.25)
-    )
-    n_outliers = (scores > outlier_threshold).sum()
+    outlier_threshold = q3 + 1.5 * (q3 - q1)
+    n_outliers = int((score_values > outlier_threshold).sum())
     print(f"  Score outliers (>{outlier_threshold:.0f}): {n_outliers:,}")
 
     # ── 1.7 Subreddit & Term Distribution ────────────────────────────────
@@ -200,9 +333,11 @@ def engineer_official_features(df_official):
     df = df_official.copy()
 
     # Interpolate the 1 missing month (Oct 2025)
-    n_before = df.isnull().sum().sum()
-    df = df.interpolate(method="linear")
-    n_after = df.isnull().sum().sum()
+    n_before = int(df.isna().to_numpy().sum())
+    n_after = 0
+    if n_before:
+        df = df.interpolate(method="linear")
+        n_after = int(df.isna().to_numpy().sum())
     print(f"\n  Interpolated {n_before - n_after} missing values.")
 
     # ── Computed Spreads ─────────────────────────────────────────────────
@@ -222,8 +357,9 @@ def engineer_official_features(df_official):
     df["CIVPART_MOM"]  = df["CIVPART"].diff()
 
     # ── 3-month rolling averages ─────────────────────────────────────────
-    for col in ["UNRATE", "U6RATE", "LNS14000036", "CGBD2024", "CIVPART"]:
-        df[f"{col}_3MA"] = df[col].rolling(window=3, min_periods=1).mean()
+    ma_cols = ["UNRATE", "U6RATE", "LNS14000036", "CGBD2024", "CIVPART"]
+    ma = df[ma_cols].rolling(window=3, min_periods=1).mean()  # One 2-D pass
+    df = pd.concat([df, ma.add_suffix("_3MA")], axis=1)
 
     # ── Year-over-year change ────────────────────────────────────────────
     df["UNRATE_YOY"] = df["UNRATE"].diff(12)
@@ -231,7 +367,25 @@ def engineer_official_features(df_official):
     print(f"  ✓ Added MoM changes, 3-month rolling averages, YoY change")
     print(f"  ✓ Final shape: {df.shape}")
 
-    return df
+    return downcast_floats(df)
+
+
+def _vader_analyzer():
+    """Per-process VADER analyzer, so the lexicon is loaded only once."""
+    global _VADER
+    if _VADER is None:
+        _VADER = SentimentIntensityAnalyzer()
+    return _VADER
+
+
+def _score_vader_chunk(texts):
+    """Score a list of texts with VADER → (n, 4) array of neg/neu/pos/compound."""
+    polarity_scores = _vader_analyzer().polarity_scores
+    out = np.empty((len(texts), 4))
+    for j, text in enumerate(texts):
+        s = polarity_scores(text if len(text) <= 5000 else text[:5000])  # Cap length
+        out[j] = (s["neg"], s["neu"], s["pos"], s["compound"])
+    return out
 
 
 def engineer_reddit_features(df_reddit):
@@ -242,44 +396,74 @@ def engineer_reddit_features(df_reddit):
 
     # ── VADER Sentiment Analysis ─────────────────────────────────────────
     print("\n  Running VADER sentiment analysis on titles + selftext...")
-    analyzer = SentimentIntensityAnalyzer()
 
     # Combine title and selftext for richer sentiment signal
     texts = (df_reddit["title"].fillna("") + " " +
              df_reddit["selftext"].fillna(""))
 
-    sentiments = []
-    for i, text in enumerate(texts):
-        if i % 500 == 0:
-            print(f"    Progress: {i:,}/{len(texts):,} posts scored...")
-        scores = analyzer.polarity_scores(str(text)[:5000])  # Cap length
-        sentiments.append(scores)
-
-    sent_df = pd.DataFrame(sentiments)
-    df_reddit["vader_neg"]      = sent_df["neg"].values
-    df_reddit["vader_neu"]      = sent_df["neu"].values
-    df_reddit["vader_pos"]      = sent_df["pos"].values
-    df_reddit["vader_compound"] = sent_df["compound"].values
-    print(f"  ✓ VADER scores computed for {len(texts):,} posts.")
+    # Empty texts score all-zero in VADER, so only tokenize non-empty rows
+    n_texts = len(texts)
+    text_values = texts.to_numpy()
+    nonempty_idx = np.flatnonzero(texts.str.strip().ne("").to_numpy())
+
+    # Score each distinct text once (cross-posts and re-posts repeat) and
+    # scatter the scores back through the factorize codes
+    codes, unique_texts = pd.factorize(text_values[nonempty_idx])
+    unique_texts = np.asarray(unique_texts, dtype=object)
+
+    # Score contiguous chunks in parallel; each worker loads its own lexicon
+    chunk_texts = [unique_texts[k:k + VADER_CHUNK_SIZE].tolist()
+                   for k in range(0, len(unique_texts), VADER_CHUNK_SIZE)]
+    n_workers = min(VADER_N_JOBS, len(chunk_texts))
+
+    unique_scores = np.zeros((len(unique_texts), 4))
+    n_scored = 0
+    pool = (ProcessPoolExecutor(max_workers=n_workers) if n_workers > 1
+            else contextlib.nullcontext())
+    with pool as executor:
+        mapper = executor.map if executor is not None else map
+        for chunk_scores in mapper(_score_vader_chunk, chunk_texts):
+            unique_scores[n_scored:n_scored + len(chunk_scores)] = chunk_scores
+            n_scored += len(chunk_scores)
+            print(f"    Progress: {n_scored:,}/{len(unique_texts):,} "
+                  f"unique texts scored...")
+
+    scores = np.zeros((n_texts, 4))
+    scores[nonempty_idx] = unique_scores[codes]
+    neg, neu, pos, compound = scores.T
+
+    df_reddit = df_reddit.assign(
+        vader_neg=neg, vader_neu=neu, vader_pos=pos, vader_compound=compound,
+    )
+    print(f"  ✓ VADER scores computed for {n_texts:,} posts "
+          f"({n_texts - len(nonempty_idx):,} empty, skipped).")
     print(f"    Mean compound: {df_reddit['vader_compound'].mean():.3f}")
     print(f"    Median compound: {df_reddit['vader_compound'].median():.3f}")
 
     # ── Monthly Aggregation ──────────────────────────────────────────────
     print("\n  Aggregating to monthly time-series...")
-    df_reddit["year_month"] = df_reddit["created_utc"].dt.to_period("M")
+    if "year_month" not in df_reddit.columns:  # Already set by the audit
+        df_reddit["year_month"] = df_reddit["created_utc"].dt.to_period("M")
+
+    # Precompute sentiment flags so every reducer is a built-in (no lambdas)
+    sentiment_flags = df_reddit.assign(
+        is_negative=(df_reddit["vader_compound"] < -0.05).astype(np.float64),
+        is_positive=(df_reddit["vader_compound"] > 0.05).astype(np.float64),
+    )
 
-    monthly = df_reddit.groupby("year_month").agg(
+    monthly = sentiment_flags.groupby("year_month", sort=False,
+                                     observed=True).agg(
         post_count=("post_id", "count"),
         avg_score=("score", "mean"),
         median_score=("score", "median"),
         total_score=("score", "sum"),
         avg_sentiment=("vader_compound", "mean"),
         median_sentiment=("vader_compound", "median"),
-        pct_negative=("vader_compound", lambda x: (x < -0.05).mean()),
-        pct_positive=("vader_compound", lambda x: (x > 0.05).mean()),
+        pct_negative=("is_negative", "mean"),
+        pct_positive=("is_positive", "mean"),
         unique_subreddits=("subreddit", "nunique"),
         avg_text_length=("text_length", "mean"),
-    ).reset_index()
+    ).sort_index().reset_index()  # One sort of the ~70 month keys
 
     # Convert period to datetime for merging
     monthly["Date"] = monthly["year_month"].dt.to_timestamp()
@@ -290,18 +474,19 @@ def engineer_reddit_features(df_reddit):
         monthly["post_count"] * monthly["pct_negative"]
     )
 
-    # Normalize to 0-100 scale for interpretability
-    if monthly["distress_index"].max() > 0:
-        monthly["distress_index_norm"] = (
-            monthly["distress_index"] / monthly["distress_index"].max() * 100
-        )
+    # Normalize to 0-100 scale for interpretability (max reduced once);
+    # folding the constants gives a single array pass, one temporary
+    distress = monthly["distress_index"].to_numpy()
+    distress_max = np.nanmax(distress) if len(distress) else 0
+    if distress_max > 0:
+        monthly["distress_index_norm"] = distress * (100.0 / distress_max)
     else:
         monthly["distress_index_norm"] = 0
 
     print(f"  ✓ Monthly aggregation: {len(monthly)} months")
     print(f"  ✓ Distress Index computed (0-100 scale)")
 
-    return df_reddit, monthly
+    return downcast_floats(df_reddit), downcast_floats(monthly)
 
 
 def process_census_data(df_census):
@@ -327,13 +512,12 @@ def merge_datasets(df_official, monthly_reddit):
     print("=" * 72)
 
     # Reddit monthly has Date column, official has Date as index
-    df_merged = pd.merge(
-        df_official.reset_index(),
-        monthly_reddit,
-        on="Date",
-        how="outer",
+    # Outer join on the sorted monthly index returns rows already in date order
+    df_merged = (
+        df_official.join(monthly_reddit.set_index("Date"), how="outer")
+        .rename_axis("Date")
+        .reset_index()
     )
-    df_merged = df_merged.sort_values("Date").reset_index(drop=True)
 
     print(f"  ✓ Merged shape: {df_merged.shape}")
     print(f"  ✓ Date range: {df_merged['Date'].min()} → {df_merged['Date'].max()}")
@@ -349,9 +533,32 @@ def merge_datasets(df_official, monthly_reddit):
 # ═════════════════════════════════════════════════════════════════════════════
 # SECTION 3: EDA VISUALIZATIONS
 # ═════════════════════════════════════════════════════════════════════════════
+def _subplots(nrows=1, ncols=1, figsize=None, **kwargs):
+    """
+    plt.subplots() on one shared, pyplot-managed figure that is cleared and
+    resized for each plot, so fonts and canvas are initialised only once.
+    """
+    global _FIGURE
+    if _FIGURE is None or not plt.fignum_exists(_FIGURE.number):
+        _FIGURE = plt.figure()
+    fig = _FIGURE
+    plt.figure(fig.number)  # Make it current for plt.* helpers
+    fig.clear()
+    fig.set_size_inches(figsize or plt.rcParams["figure.figsize"])
+    fig.subplots_adjust(**{k: plt.rcParams[f"figure.subplot.{k}"] for k in
+                           ("left", "right", "top", "bottom",
+                            "wspace", "hspace")})
+    return fig, fig.subplots(nrows, ncols, **kwargs)
+
+
+def _clear_figure(fig):
+    """Release a plot's artists; the shared figure itself is kept for reuse."""
+    fig.clear()
+
+
 def plot_1_unemployment_rates(df_official, save_dir):
     """Plot 1: Multi-line comparison of all unemployment rates over time."""
-    fig, ax = plt.subplots(figsize=(14, 7))
+    fig, ax = _subplots(figsize=(14, 7))
 
     ax.plot(df_official.index, df_official["UNRATE"],
             color=COLORS["u3"], linewidth=2.5, label="U-3 (Official Rate)",
@@ -382,14 +589,15 @@ def plot_1_unemployment_rates(df_official, save_dir):
     ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y"))
     ax.xaxis.set_major_locator(mdates.YearLocator())
 
+    fig.subplots_adjust(left=0.05, right=0.99, top=0.92, bottom=0.09)
     plt.savefig(os.path.join(save_dir, "01_unemployment_rates.png"))
-    plt.close()
+    _clear_figure(fig)
     print("  ✓ Plot 1: Unemployment rates comparison saved.")
 
 
 def plot_2_u6_u3_spread(df_official, save_dir):
     """Plot 2: Area chart showing U6-U3 spread over time."""
-    fig, ax = plt.subplots(figsize=(14, 6))
+    fig, ax = _subplots(figsize=(14, 6))
 
     spread = df_official["U6_U3_SPREAD"]
     ax.fill_between(df_official.index, 0, spread,
@@ -412,21 +620,31 @@ def plot_2_u6_u3_spread(df_official, save_dir):
     ax.grid(True)
     ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y"))
 
+    fig.subplots_adjust(left=0.05, right=0.99, top=0.91, bottom=0.11)
     plt.savefig(os.path.join(save_dir, "02_u6_u3_spread.png"))
-    plt.close()
+    _clear_figure(fig)
     print("  ✓ Plot 2: U6-U3 spread saved.")
 
 
 def plot_3_reality_gap(df_merged, save_dir):
     """Plot 3: Dual-axis — Official UNRATE vs Reddit distress volume."""
-    fig, ax1 = plt.subplots(figsize=(14, 7))
+    fig, ax1 = _subplots(figsize=(14, 7))
 
-    # Bar chart: Reddit post volume
+    # Filled steps: Reddit post volume — one StepPatch instead of N bars,
+    # with each month's step centred on its date like the old bars
     dates = pd.to_datetime(df_merged["Date"])
-    mask = df_merged["post_count"] > 0
-    ax1.bar(dates[mask], df_merged.loc[mask, "post_count"],
-            width=25, alpha=0.6, color=COLORS["reddit"],
-            label="Reddit Distress Posts", zorder=3)
+    x = mdates.date2num(dates)
+    if len(x) >= 2:
+        mid = (x[:-1] + x[1:]) / 2
+        edges = np.concatenate([[2 * x[0] - mid[0]], mid,
+                                [2 * x[-1] - mid[-1]]])
+    elif len(x) == 1:
+        # No neighbour to take a midpoint from: the old 25-day bar width
+        edges = np.array([x[0] - 12.5, x[0] + 12.5])
+    if len(x):  # Zero months: nothing to draw, as with the old bar call
+        ax1.stairs(df_merged["post_count"].to_numpy(), edges, fill=True,
+                   alpha=0.6, color=COLORS["reddit"],
+                   label="Reddit Distress Posts", zorder=3)
     ax1.set_ylabel("Reddit Posts per Month", color=COLORS["reddit"])
     ax1.tick_params(axis="y", labelcolor=COLORS["reddit"])
 
@@ -453,30 +671,41 @@ def plot_3_reality_gap(df_merged, save_dir):
     ax1.xaxis.set_major_formatter(mdates.DateFormatter("%Y"))
     ax1.grid(True, alpha=0.3)
 
+    fig.subplots_adjust(left=0.06, right=0.94, top=0.92, bottom=0.09)
     plt.savefig(os.path.join(save_dir, "03_reality_gap.png"))
-    plt.close()
+    _clear_figure(fig)
     print("  ✓ Plot 3: Reality Gap dual-axis saved.")
 
 
 def plot_4_heatmap(df_reddit, save_dir):
     """Plot 4: Heatmap of posts per subreddit × month."""
-    fig, ax = plt.subplots(figsize=(16, 6))
+    fig, ax = _subplots(figsize=(16, 6))
 
     # Create pivot table
-    df_reddit["ym_str"] = df_reddit["created_utc"].dt.strftime("%Y-%m")
-    pivot = df_reddit.groupby(["subreddit", "ym_str"]).size().unstack(fill_value=0)
-
-    # Sort chronologically
-    pivot = pivot.reindex(columns=sorted(pivot.columns))
+    ym_str = df_reddit["year_month"].astype(str).rename("ym_str")
+    pivot = (df_reddit.groupby(["subreddit", ym_str], sort=False, observed=True)
+             .size().unstack(fill_value=0))
+
+    # Sort subreddits and months once, after the unsorted groupby
+    pivot = pivot.sort_index().reindex(columns=sorted(pivot.columns))
+
+    # Draw the count matrix directly (what sns.heatmap does under the hood)
+    counts = pivot.to_numpy(dtype=np.float32)
+    mesh = ax.pcolormesh(counts, cmap="YlOrRd",
+                         linewidth=0.3, edgecolor="#30363d")
+    cbar = fig.colorbar(mesh, ax=ax)
+    cbar.set_label("Post Count")
+    cbar.outline.set_visible(False)
+    ax.set_xlim(0, counts.shape[1])
+    ax.set_ylim(counts.shape[0], 0)  # First subreddit on top
+    for spine in ax.spines.values():
+        spine.set_visible(False)
 
     # Show every 3rd month label for readability
     cols = pivot.columns.tolist()
-    x_labels = [c if i % 3 == 0 else "" for i, c in enumerate(cols)]
-
-    sns.heatmap(pivot, ax=ax, cmap="YlOrRd",
-                linewidths=0.3, linecolor="#30363d",
-                xticklabels=x_labels,
-                cbar_kws={"label": "Post Count"})
+    ax.set_xticks(np.arange(0, len(cols), 3) + 0.5, cols[::3])
+    ax.set_yticks(np.arange(len(pivot.index)) + 0.5, pivot.index.tolist(),
+                  rotation=90, va="center")
 
     ax.set_title("Reddit Distress Activity: Subreddit × Month",
                  fontsize=16, fontweight="bold", pad=15)
@@ -484,14 +713,15 @@ def plot_4_heatmap(df_reddit, save_dir):
     ax.set_ylabel("")
     plt.xticks(rotation=45, ha="right", fontsize=8)
 
+    fig.subplots_adjust(left=0.04, right=0.99, top=0.91, bottom=0.15)
     plt.savefig(os.path.join(save_dir, "04_heatmap.png"))
-    plt.close()
+    _clear_figure(fig)
     print("  ✓ Plot 4: Heatmap saved.")
 
 
 def plot_5_search_terms(df_reddit, save_dir):
     """Plot 5: Horizontal bar chart of search term frequency."""
-    fig, ax = plt.subplots(figsize=(10, 7))
+    fig, ax = _subplots(figsize=(10, 7))
 
     term_counts = df_reddit["search_term"].value_counts().sort_values()
 
@@ -509,28 +739,31 @@ def plot_5_search_terms(df_reddit, save_dir):
     ax.set_xlabel("Number of Posts")
     ax.grid(axis="x", alpha=0.3)
 
+    fig.subplots_adjust(left=0.20, right=0.98, top=0.92, bottom=0.09)
     plt.savefig(os.path.join(save_dir, "05_search_terms.png"))
-    plt.close()
+    _clear_figure(fig)
     print("  ✓ Plot 5: Search term frequency saved.")
 
 
 def plot_6_sentiment_timeseries(monthly, save_dir):
     """Plot 6: Monthly average VADER sentiment over time."""
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10),
+    fig, (ax1, ax2) = _subplots(2, 1, figsize=(14, 10),
                                      gridspec_kw={"height_ratios": [2, 1]})
 
-    dates = monthly["Date"]
+    # Extract each value column once; dates stay a Series for the unit converter
+    dates     = monthly["Date"]
+    sentiment = monthly["avg_sentiment"].to_numpy()
+    pct_neg   = monthly["pct_negative"].to_numpy() * 100
+    is_neg    = sentiment < 0
 
     # Top: Sentiment compound score
-    ax1.plot(dates, monthly["avg_sentiment"],
+    ax1.plot(dates, sentiment,
              color=COLORS["u3"], linewidth=2, label="Avg Compound Score")
-    ax1.fill_between(dates, 0, monthly["avg_sentiment"],
-                     where=monthly["avg_sentiment"] < 0,
+    ax1.fill_between(dates, 0, sentiment, where=is_neg,
                      alpha=0.3, color=COLORS["reddit"],
-                     label="Negative Territory")
-    ax1.fill_between(dates, 0, monthly["avg_sentiment"],
-                     where=monthly["avg_sentiment"] >= 0,
-                     alpha=0.3, color=COLORS["degree"])
+                     label="Negative Territory", rasterized=True)
+    ax1.fill_between(dates, 0, sentiment, where=~is_neg,
+                     alpha=0.3, color=COLORS["degree"], rasterized=True)
     ax1.axhline(y=0, color="#8b949e", linestyle="-", alpha=0.5)
     ax1.set_title("Monthly Sentiment Trajectory (VADER Compound Score)",
                   fontsize=16, fontweight="bold", pad=15)
@@ -539,7 +772,7 @@ def plot_6_sentiment_timeseries(monthly, save_dir):
     ax1.grid(True)
 
     # Bottom: % negative posts
-    ax2.bar(dates, monthly["pct_negative"] * 100,
+    ax2.bar(dates, pct_neg,
             width=25, color=COLORS["reddit"], alpha=0.7,
             label="% Posts with Negative Sentiment")
     ax2.set_ylabel("% Negative Posts")
@@ -548,41 +781,53 @@ def plot_6_sentiment_timeseries(monthly, save_dir):
     ax2.grid(True)
     ax2.xaxis.set_major_formatter(mdates.DateFormatter("%Y"))
 
-    plt.tight_layout()
+    fig.subplots_adjust(left=0.07, right=0.99, top=0.94, bottom=0.07,
+                        hspace=0.10)
     plt.savefig(os.path.join(save_dir, "06_sentiment_timeseries.png"))
-    plt.close()
+    _clear_figure(fig)
     print("  ✓ Plot 6: Sentiment time-series saved.")
 
 
+def _pearson(x, y):
+    """Pearson r of two arrays, ignoring pairs where either value is NaN."""
+    ok = ~(np.isnan(x) | np.isnan(y))
+    return np.corrcoef(x[ok], y[ok])[0, 1]
+
+
 def plot_7_correlation_scatter(df_merged, save_dir):
     """Plot 7: Scatter plots — time-colored U-3 vs volume, and sentiment vs U-3."""
-    fig, axes = plt.subplots(1, 2, figsize=(15, 7))
+    fig, axes = _subplots(1, 2, figsize=(15, 7))
 
-    # Filter to months with Reddit data
-    mask = df_merged["post_count"] > 0
-    data = df_merged[mask].copy()
+    # Filter to months with Reddit data; slice only the columns drawn below
+    mask = (df_merged["post_count"] > 0).to_numpy()
+    data = df_merged.loc[mask, ["Date", "UNRATE", "post_count",
+                                "avg_sentiment", "pct_negative"]]
 
     if len(data) < 5:
         print("  ⚠ Not enough data for correlation scatter.")
-        plt.close()
+        _clear_figure(fig)
         return
 
+    # Pull each column out once as a float64 array
+    unrate     = data["UNRATE"].to_numpy(dtype=np.float64)
+    post_count = data["post_count"].to_numpy(dtype=np.float64)
+    sentiment  = data["avg_sentiment"].to_numpy(dtype=np.float64)
+    pct_neg    = data["pct_negative"].to_numpy(dtype=np.float64)
+
     # ── Left Panel: Time-colored U-3 vs Post Volume ──────────────────────
     ax = axes[0]
-    dates_numeric = mdates.date2num(pd.to_datetime(data["Date"]))
+    dates_numeric = mdates.date2num(data["Date"].to_numpy())
     scatter = ax.scatter(
-        data["UNRATE"], data["post_count"],
+        unrate, post_count,
         c=dates_numeric, cmap="cool", alpha=0.75, s=60,
-        edgecolors="#30363d", linewidths=0.5, zorder=5,
+        edgecolors="#30363d", linewidths=0.5, zorder=5, rasterized=True,
     )
     cbar = plt.colorbar(scatter, ax=ax, pad=0.02)
     cbar.ax.set_ylabel("Date", fontsize=9)
-    # Format colorbar ticks as years
-    tick_locs = cbar.get_ticks()
-    cbar.set_ticklabels([
-        mdates.num2date(t).strftime("%Y") if t > 0 else ""
-        for t in tick_locs
-    ])
+    # Tick the colorbar on year boundaries, formatted lazily at draw time
+    cbar.locator = mdates.YearLocator()
+    cbar.formatter = mdates.DateFormatter("%Y")
+    cbar.update_ticks()
 
     # Annotate regimes instead of misleading linear fit
     ax.annotate("COVID spike\n(high U-3, low posts)",
@@ -594,7 +839,7 @@ def plot_7_correlation_scatter(df_merged, save_dir):
                 bbox=dict(boxstyle="round,pad=0.3", facecolor="#1c2128",
                           edgecolor="#ffa657", alpha=0.8))
 
-    corr = data["UNRATE"].corr(data["post_count"])
+    corr = _pearson(unrate, post_count)
     ax.set_title(f"U-3 vs Distress Volume (r = {corr:.3f})\nColor = Time →",
                  fontsize=13, fontweight="bold")
     ax.set_xlabel("U-3 Rate (%)")
@@ -603,28 +848,31 @@ def plot_7_correlation_scatter(df_merged, save_dir):
 
     # ── Right Panel: UNRATE vs Avg Sentiment ─────────────────────────────
     ax = axes[1]
-    sent_data = data.dropna(subset=["avg_sentiment", "UNRATE"])
+    valid = ~(np.isnan(sentiment) | np.isnan(unrate))
+    sent_x, sent_y, sent_c = unrate[valid], sentiment[valid], pct_neg[valid]
 
     scatter2 = ax.scatter(
-        sent_data["UNRATE"], sent_data["avg_sentiment"],
-        c=sent_data["pct_negative"], cmap="RdYlGn_r", alpha=0.75,
+        sent_x, sent_y,
+        c=sent_c, cmap="RdYlGn_r", alpha=0.75,
         s=60, edgecolors="#30363d", linewidths=0.5, zorder=5,
+        rasterized=True,
     )
     cbar2 = plt.colorbar(scatter2, ax=ax, pad=0.02)
     cbar2.ax.set_ylabel("% Negative Posts", fontsize=9)
 
     # Add trend line for this relationship (more legitimate than vol vs rate)
-    z = np.polyfit(sent_data["UNRATE"], sent_data["avg_sentiment"], 1)
-    p = np.poly1d(z)
-    x_line = np.linspace(sent_data["UNRATE"].min(),
-                         sent_data["UNRATE"].max(), 100)
-    ax.plot(x_line, p(x_line), color=COLORS["accent"],
+    # Closed-form least-squares line: slope = cov(x, y) / var(x)
+    x_mean, y_mean = sent_x.mean(), sent_y.mean()
+    slope = (np.dot(sent_x - x_mean, sent_y - y_mean) /
+             np.dot(sent_x - x_mean, sent_x - x_mean))
+    x_line = np.linspace(sent_x.min(), sent_x.max(), 100)
+    ax.plot(x_line, y_mean + slope * (x_line - x_mean), color=COLORS["accent"],
             linewidth=2, linestyle="--", alpha=0.7)
 
     # Neutral sentiment line
     ax.axhline(y=0, color="#8b949e", linestyle=":", alpha=0.4)
 
-    corr2 = sent_data["UNRATE"].corr(sent_data["avg_sentiment"])
+    corr2 = _pearson(sent_x, sent_y)
     ax.set_title(f"U-3 vs Avg Sentiment (r = {corr2:.3f})\nColor = % Negative →",
                  fontsize=13, fontweight="bold")
     ax.set_xlabel("U-3 Rate (%)")
@@ -632,22 +880,28 @@ def plot_7_correlation_scatter(df_merged, save_dir):
     ax.grid(True)
 
     plt.suptitle("Statistical Evidence: Do Official Rates Predict Distress?",
-                 fontsize=16, fontweight="bold", y=1.02)
-    plt.tight_layout()
+                 fontsize=16, fontweight="bold")
+    fig.subplots_adjust(left=0.06, right=0.99, top=0.85, bottom=0.09,
+                        wspace=0.18)
     plt.savefig(os.path.join(save_dir, "07_correlation_scatter.png"))
-    plt.close()
+    _clear_figure(fig)
     print("  ✓ Plot 7: Correlation scatter saved.")
 
 
+def short_labels(categories):
+    """Last "!!"-separated segment of each Census label, capped at 35 chars."""
+    return (categories.astype(str).str.rsplit("!!", n=1).str[-1]
+            .str.slice(0, 35))
+
+
 def plot_8_census_mismatch(df_degree, df_industry, save_dir):
     """Plot 8: Degree fields vs Industry employment — structural mismatch."""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
+    fig, (ax1, ax2) = _subplots(1, 2, figsize=(16, 8))
 
     # ── Degree Fields (top categories, 25-39 age group) ──────────────────
     # Filter for 25-39 age group summary rows
     degree_data = df_degree[
-        df_degree["Category"].str.contains("25 to 39 years", na=False) &
-        ~df_degree["Category"].str.contains("Total:!!Male:!!25|Total:!!Female:!!25", na=False, regex=True)
+        df_degree["Category"].str.contains(DEGREE_25_39_PATTERN, na=False)
     ].copy()
 
     if len(degree_data) == 0:
@@ -660,9 +914,7 @@ def plot_8_census_mismatch(df_degree, df_industry, save_dir):
         ].head(10).copy()
 
     if len(degree_data) > 0:
-        degree_data["short_label"] = degree_data["Category"].apply(
-            lambda x: x.split("!!")[-1][:35] if "!!" in str(x) else str(x)[:35]
-        )
+        degree_data["short_label"] = short_labels(degree_data["Category"])
         degree_data = degree_data.nlargest(8, "Count")
 
         ax1.barh(degree_data["short_label"], degree_data["Count"],
@@ -676,24 +928,15 @@ def plot_8_census_mismatch(df_degree, df_industry, save_dir):
                  transform=ax1.transAxes, fontsize=14, color="#8b949e")
 
     # ── Industry Employment (top sectors) ────────────────────────────────
-    industry_data = df_industry[
-        ~df_industry["Category"].str.contains("Total:", na=False) |
-        df_industry["Category"].str.match(r"^Total:!!(Male|Female):!![A-Z]", na=False)
-    ].copy()
-
     # Get top-level industry categories (Total:!!Male:!!IndustryName pattern)
     industry_top = df_industry[
-        df_industry["Category"].str.match(
-            r"^Total:!!(Male|Female):!![A-Z]", na=False
-        )
+        df_industry["Category"].str.match(INDUSTRY_TOP_PATTERN, na=False)
     ].copy()
 
     if len(industry_top) > 0:
-        industry_top["short_label"] = industry_top["Category"].apply(
-            lambda x: x.split("!!")[-1][:35] if "!!" in str(x) else str(x)[:35]
-        )
+        industry_top["short_label"] = short_labels(industry_top["Category"])
         # Aggregate Male + Female for same industry
-        industry_agg = industry_top.groupby("short_label")["Count"].sum()
+        industry_agg = industry_top.groupby("short_label", sort=False)["Count"].sum()
         industry_agg = industry_agg.nlargest(10).sort_values()
 
         ax2.barh(industry_agg.index, industry_agg.values,
@@ -708,16 +951,33 @@ def plot_8_census_mismatch(df_degree, df_industry, save_dir):
                  color="#8b949e")
 
     plt.suptitle("Structural Mismatch: Degrees vs. Jobs",
-                 fontsize=16, fontweight="bold", y=1.02)
-    plt.tight_layout()
+                 fontsize=16, fontweight="bold")
+    fig.subplots_adjust(left=0.20, right=0.98, top=0.87, bottom=0.08,
+                        wspace=0.62)
     plt.savefig(os.path.join(save_dir, "08_census_mismatch.png"))
-    plt.close()
+    _clear_figure(fig)
     print("  ✓ Plot 8: Census mismatch saved.")
 
 
 # ═════════════════════════════════════════════════════════════════════════════
 # SECTION 4: CORRELATION ANALYSIS & SUMMARY
 # ═════════════════════════════════════════════════════════════════════════════
+def _print_correlations(corr):
+    """Print one correlation column, ascending, as a single block of lines."""
+    if corr.empty:
+        return
+    corr = corr.sort_values()
+    values = corr.to_numpy()
+    abs_values = np.abs(values)
+    directions = np.where(values > 0, "↗", "↘")
+    strengths = np.where(abs_values > 0.5, "strong",
+                         np.where(abs_values > 0.3, "moderate", "weak"))
+    print("\n".join(
+        f"    {d} {var:<22s}: r = {val:+.3f} ({st})"
+        for var, val, d, st in zip(corr.index, values, directions, strengths)
+    ))
+
+
 def correlation_analysis(df_merged):
     """Print correlation matrix between key features."""
     print("\n" + "=" * 72)
@@ -730,31 +990,23 @@ def correlation_analysis(df_merged):
 
     # Filter to only columns that exist
     cols = [c for c in cols if c in df_merged.columns]
-    data = df_merged[cols].dropna()
+    # One C-contiguous float64 block of complete rows → a single corrcoef
+    arr = df_merged[cols].to_numpy(dtype=np.float64)
+    arr = np.ascontiguousarray(arr[~np.isnan(arr).any(axis=1)])
 
-    if len(data) < 5:
+    if len(arr) < 5:
         print("  ⚠ Not enough overlapping data for correlation.")
         return
 
-    corr_matrix = data.corr()
+    corr_matrix = pd.DataFrame(np.corrcoef(arr, rowvar=False),
+                               index=cols, columns=cols)
     print("\n  Key Correlations with Reddit Post Volume:")
     if "post_count" in corr_matrix:
-        pc_corr = corr_matrix["post_count"].drop("post_count").sort_values()
-        for var, val in pc_corr.items():
-            direction = "↗" if val > 0 else "↘"
-            strength = "strong" if abs(val) > 0.5 else (
-                "moderate" if abs(val) > 0.3 else "weak")
-            print(f"    {direction} {var:<22s}: r = {val:+.3f} ({strength})")
+        _print_correlations(corr_matrix["post_count"].drop("post_count"))
 
     print("\n  Key Correlations with Avg Sentiment:")
     if "avg_sentiment" in corr_matrix:
-        sent_corr = corr_matrix["avg_sentiment"].drop(
-            "avg_sentiment").sort_values()
-        for var, val in sent_corr.items():
-            direction = "↗" if val > 0 else "↘"
-            strength = "strong" if abs(val) > 0.5 else (
-                "moderate" if abs(val) > 0.3 else "weak")
-            print(f"    {direction} {var:<22s}: r = {val:+.3f} ({strength})")
+        _print_correlations(corr_matrix["avg_sentiment"].drop("avg_sentiment"))
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -767,10 +1019,15 @@ def main():
 
     # ── Load Data ────────────────────────────────────────────────────────
     print("Loading datasets...")
-    df_official = pd.read_csv(OFFICIAL_CSV, index_col="Date", parse_dates=True)
-    df_census   = pd.read_csv(CENSUS_CSV)
-    df_reddit   = pd.read_csv(REDDIT_CSV)
-    df_reddit["created_utc"] = pd.to_datetime(df_reddit["created_utc"])
+    df_official = read_csv_fast(OFFICIAL_CSV, index_col="Date")
+    df_official.index = pd.to_datetime(df_official.index)
+    df_census   = read_csv_fast(CENSUS_CSV, usecols=CENSUS_COLS)
+    df_reddit   = read_csv_fast(REDDIT_CSV)
+    # Task C writes "YYYY-MM-DD HH:MM:SS"; the pyarrow reader already parses
+    # it, otherwise the ISO8601 fast path avoids per-row format inference
+    df_reddit["created_utc"] = pd.to_datetime(
+        df_reddit["created_utc"], format="ISO8601"
+    ).astype("datetime64[s]")  # Second resolution is all the data has
 
     print(f"  ✓ Official: {df_official.shape}")
     print(f"  ✓ Census:   {df_census.shape}")
@@ -787,15 +1044,25 @@ def main():
 
     # ── Save engineered data ─────────────────────────────────────────────
     merged_path = os.path.join(DATA_DIR, "df_merged_features.csv")
-    df_merged.to_csv(merged_path, index=False)
-    print(f"\n  ✅ Merged features saved to {merged_path}")
+    # CSVs are written on a background thread while the plots render
+    csv_writer = ThreadPoolExecutor(max_workers=1)
+    merged_pq, merged_csv, merged_skipped = save_table(
+        df_merged, merged_path, csv_writer)
+    print(f"\n  ✅ Merged features saved to {merged_path}"
+          + (" (unchanged, write skipped)" if merged_skipped else ""))
+    if merged_pq:
+        print(f"     (+ {os.path.basename(merged_pq)})")
     print(f"     Shape: {df_merged.shape}")
     print(f"     Columns: {list(df_merged.columns)}")
 
     # Also save the sentiment-scored Reddit data
     reddit_scored_path = os.path.join(DATA_DIR, "df_reddit_scored.csv")
-    df_reddit.to_csv(reddit_scored_path, index=False)
-    print(f"  ✅ Scored Reddit data saved to {reddit_scored_path}")
+    reddit_scored_pq, reddit_scored_csv, reddit_scored_skipped = save_table(
+        df_reddit, reddit_scored_path, csv_writer)
+    print(f"  ✅ Scored Reddit data saved to {reddit_scored_path}"
+          + (" (unchanged, write skipped)" if reddit_scored_skipped else ""))
+    if reddit_scored_pq:
+        print(f"     (+ {os.path.basename(reddit_scored_pq)})")
 
     # ── Section 3: Visualizations ────────────────────────────────────────
     print("\n" + "=" * 72)
@@ -803,18 +1070,31 @@ def main():
     print("=" * 72)
     os.makedirs(PLOT_DIR, exist_ok=True)
 
-    plot_1_unemployment_rates(df_official, PLOT_DIR)
-    plot_2_u6_u3_spread(df_official, PLOT_DIR)
-    plot_3_reality_gap(df_merged, PLOT_DIR)
-    plot_4_heatmap(df_reddit, PLOT_DIR)
-    plot_5_search_terms(df_reddit, PLOT_DIR)
-    plot_6_sentiment_timeseries(monthly_reddit, PLOT_DIR)
-    plot_7_correlation_scatter(df_merged, PLOT_DIR)
-    plot_8_census_mismatch(df_degree, df_industry, PLOT_DIR)
+    plots = [
+        (plot_1_unemployment_rates,   (df_official,)),
+        (plot_2_u6_u3_spread,         (df_official,)),
+        (plot_3_reality_gap,          (df_merged,)),
+        (plot_4_heatmap,              (df_reddit,)),
+        (plot_5_search_terms,         (df_reddit,)),
+        (plot_6_sentiment_timeseries, (monthly_reddit,)),
+        (plot_7_correlation_scatter,  (df_merged,)),
+        (plot_8_census_mismatch,      (df_degree, df_industry)),
+    ]
+    for i, (plot_fn, args) in enumerate(plots, start=1):
+        plot_fn(*args, PLOT_DIR)
+        if i % GC_EVERY_N_PLOTS == 0:
+            gc.collect()
+    plt.close("all")
 
     # ── Section 4: Correlation Analysis ──────────────────────────────────
     correlation_analysis(df_merged)
 
+    # ── Wait for the background CSV writes (re-raises any write error) ───
+    for csv_future in (merged_csv, reddit_scored_csv):
+        if csv_future is not None:
+            csv_future.result()
+    csv_writer.shutdown()
+
     # ── Final Summary ────────────────────────────────────────────────────
     print("\n" + "=" * 72)
     print("EDA & GAP ANALYSIS COMPLETE")
@@ -18,6 +18,7 @@ import os
 import sys
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from fredapi import Fred
 
@@ -58,11 +59,17 @@ SERIES = {
 OUTPUT_DIR  = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, "df_official.csv")
 
+# Per-series response cache, keyed by (series_id, start, end)
+CACHE_DIR   = os.path.join(OUTPUT_DIR, ".cache")
+
+# FRED requests are I/O-bound — fetch every series at once
+MAX_WORKERS = len(SERIES)
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 2. HELPER: Fetch a single FRED series with retry logic
 # ─────────────────────────────────────────────────────────────────────────────
 def fetch_series(fred_client, series_id, description, start, end,
-                 max_retries=3, backoff_factor=2):
+                 max_retries=3, backoff_factor=2, log=print):
     """
     Fetch a single FRED time-series. Implements exponential backoff to
     handle API rate limits (HTTP 429) or transient network errors.
@@ -75,32 +82,44 @@ def fetch_series(fred_client, series_id, description, start, end,
     start / end   : str, date boundaries
     max_retries   : int, number of retry attempts
     backoff_factor: int, multiplier for exponential wait
+    log           : callable taking one progress line (default print)
 
     Returns
     -------
     pd.Series with DatetimeIndex
+
+    Successful responses are cached to CACHE_DIR as Parquet, so reruns over
+    the same date range skip the network entirely.
     """
+    cache_path = os.path.join(CACHE_DIR, f"{series_id}_{start}_{end}.parquet")
+    if os.path.exists(cache_path):
+        data = pd.read_parquet(cache_path)[series_id]
+        log(f"  ✓ {series_id}: {len(data)} observations (cached).")
+        return data
+
     for attempt in range(1, max_retries + 1):
         try:
-            print(f"  [{attempt}/{max_retries}] Fetching {series_id}: "
-                  f"{description[:60]}...")
+            log(f"  [{attempt}/{max_retries}] Fetching {series_id}: "
+                f"{description[:60]}...")
             data = fred_client.get_series(
                 series_id,
                 observation_start=start,
                 observation_end=end,
             )
-            print(f"  ✓ {series_id}: {len(data)} observations retrieved.")
+            log(f"  ✓ {series_id}: {len(data)} observations retrieved.")
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            data.rename(series_id).to_frame().to_parquet(cache_path)
             return data
 
         except Exception as e:
             wait = backoff_factor ** attempt
-            print(f"  ✗ {series_id} attempt {attempt} failed: {e}")
+            log(f"  ✗ {series_id} attempt {attempt} failed: {e}")
             if attempt < max_retries:
-                print(f"    Retrying in {wait}s...")
+                log(f"    Retrying in {wait}s...")
                 time.sleep(wait)
             else:
-                print(f"  ✗✗ {series_id}: All {max_retries} attempts exhausted. "
-                      f"Returning empty series.")
+                log(f"  ✗✗ {series_id}: All {max_retries} attempts exhausted. "
+                    f"Returning empty series.")
                 return pd.Series(dtype="float64")
 
 
@@ -119,12 +138,18 @@ def main():
     # Initialize FRED client
     fred = Fred(api_key=FRED_API_KEY)
 
-    # ── Fetch all series ─────────────────────────────────────────────────
-    results = {}
-    for series_id, description in SERIES.items():
-        data = fetch_series(fred, series_id, description, START_DATE, END_DATE)
-        results[series_id] = data
-        time.sleep(0.5)  # Polite delay between requests
+    # ── Fetch all series (concurrently; backoff in fetch_series) ─────────
+    # Each worker buffers its progress lines; they are printed per series
+    # in SERIES order instead of interleaving across threads
+    logs = {series_id: [] for series_id in SERIES}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        fetched = executor.map(
+            lambda item: fetch_series(fred, *item, START_DATE, END_DATE,
+                                      log=logs[item[0]].append),
+            SERIES.items(),
+        )
+        results = dict(zip(SERIES, fetched))  # Keeps SERIES column order
+    print("\n".join(line for lines in logs.values() for line in lines))
 
     # ── Merge into a single DataFrame ────────────────────────────────────
     print("\n" + "-" * 72)
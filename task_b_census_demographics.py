@@ -19,8 +19,11 @@ import os
 import sys
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pcsv
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 1. CREDENTIALS & CONFIGURATION
@@ -55,11 +58,21 @@ YEARS_TO_TRY = [2023, 2022]
 # Output configuration
 OUTPUT_DIR  = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, "df_census_degree_mismatch.csv")
+# Variable labels never change for a given (table, year), so cache them
+CACHE_DIR   = os.path.join(OUTPUT_DIR, ".cache")
+
+# One pooled session for every Census call, so TCP/TLS connections are
+# reused across retries, tables and label fetches (4 requests in flight)
+CENSUS_BASE = "https://api.census.gov/data"
+SESSION     = requests.Session()
+SESSION.mount("https://", requests.adapters.HTTPAdapter(
+    pool_maxsize=2 * len(TABLES)))
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 2. HELPER: Fetch a full ACS table group from the Census API
 # ─────────────────────────────────────────────────────────────────────────────
-def fetch_acs_table(table_id, year, max_retries=3, backoff_factor=2):
+def fetch_acs_table(table_id, year, max_retries=3, backoff_factor=2,
+                    log=print):
     """
     Fetch ALL variables from an ACS 1-Year Detailed Table using the Census
     API 'group' endpoint. This avoids the 50-variable limit per call.
@@ -70,114 +83,117 @@ def fetch_acs_table(table_id, year, max_retries=3, backoff_factor=2):
     year         : int, e.g. 2023
     max_retries  : int
     backoff_factor : int
+    log          : callable taking one progress line (default print); the
+                   concurrent caller passes list.append and prints the
+                   buffered lines once the fetch is done
 
     Returns
     -------
     pd.DataFrame or None if all retries fail
     """
-    url = (
-        f"https://api.census.gov/data/{year}/acs/acs1"
-        f"?get=group({table_id})"
-        f"&for=us:*"
-        f"&key={CENSUS_API_KEY}"
-    )
+    url = f"{CENSUS_BASE}/{year}/acs/acs1"
+    params = {
+        "get": f"group({table_id})",
+        "for": "us:*",
+        "key": CENSUS_API_KEY,
+    }
 
     for attempt in range(1, max_retries + 1):
         try:
-            print(f"  [{attempt}/{max_retries}] Fetching {table_id} "
-                  f"(ACS 1-Year {year})...")
-            resp = requests.get(url, timeout=30)
+            log(f"  [{attempt}/{max_retries}] Fetching {table_id} "
+                f"(ACS 1-Year {year})...")
+            resp = SESSION.get(url, params=params, timeout=30)
 
             if resp.status_code == 200:
                 data = resp.json()
                 # First row is headers, subsequent rows are data
                 df = pd.DataFrame(data[1:], columns=data[0])
-                print(f"  ✓ {table_id}: {df.shape[1]} variables retrieved.")
+                log(f"  ✓ {table_id}: {df.shape[1]} variables retrieved.")
                 return df
 
             elif resp.status_code == 204:
-                print(f"  ⚠ {table_id}: Year {year} not available (HTTP 204).")
+                log(f"  ⚠ {table_id}: Year {year} not available (HTTP 204).")
                 return None
 
             elif resp.status_code == 429:
                 wait = backoff_factor ** attempt
-                print(f"  ⚠ Rate limited (HTTP 429). Waiting {wait}s...")
+                log(f"  ⚠ Rate limited (HTTP 429). Waiting {wait}s...")
                 time.sleep(wait)
 
             else:
-                print(f"  ✗ {table_id}: HTTP {resp.status_code} — {resp.text[:200]}")
+                log(f"  ✗ {table_id}: HTTP {resp.status_code} — {resp.text[:200]}")
                 if attempt < max_retries:
                     time.sleep(backoff_factor ** attempt)
 
         except requests.exceptions.RequestException as e:
             wait = backoff_factor ** attempt
-            print(f"  ✗ {table_id} attempt {attempt} failed: {e}")
+            log(f"  ✗ {table_id} attempt {attempt} failed: {e}")
             if attempt < max_retries:
-                print(f"    Retrying in {wait}s...")
+                log(f"    Retrying in {wait}s...")
                 time.sleep(wait)
 
-    print(f"  ✗✗ {table_id}: All attempts exhausted.")
+    log(f"  ✗✗ {table_id}: All attempts exhausted.")
     return None
 
 
-def fetch_variable_labels(table_id, year):
+def fetch_variable_labels(table_id, year, log=print):
     """
     Fetch the variable metadata (labels) for a Census table group.
     Returns a dict mapping variable codes → human-readable labels.
+    Non-empty results are cached to CACHE_DIR as JSON and reused on reruns.
     """
-    url = (
-        f"https://api.census.gov/data/{year}/acs/acs1/groups/{table_id}.json"
-    )
+    cache_path = os.path.join(CACHE_DIR, f"acs_labels_{table_id}_{year}.json")
+    if os.path.exists(cache_path):
+        with open(cache_path, "r") as f:
+            return json.load(f)
+
+    url = f"{CENSUS_BASE}/{year}/acs/acs1/groups/{table_id}.json"
     try:
-        resp = requests.get(url, timeout=30)
+        resp = SESSION.get(url, timeout=30)
         if resp.status_code == 200:
             group_data = resp.json()
             labels = {}
             for var_id, var_info in group_data.get("variables", {}).items():
                 labels[var_id] = var_info.get("label", var_id)
+            if labels:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(cache_path, "w") as f:
+                    json.dump(labels, f)
             return labels
     except Exception as e:
-        print(f"  ⚠ Could not fetch labels for {table_id}: {e}")
+        log(f"  ⚠ Could not fetch labels for {table_id}: {e}")
     return {}
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 3. PROCESSING: Clean and structure Census data
 # ─────────────────────────────────────────────────────────────────────────────
-def process_b15011(df_raw, labels):
+def estimate_table(df_raw, labels, table_id, label_col):
     """
-    Process B15011 (Field of Bachelor's Degree).
-    Extract Estimate columns only, map to human-readable labels,
-    and create a clean summary of degree fields.
+    Build a (label_col, Count) frame straight from an ACS table's Estimate
+    columns. The `us:*` query returns exactly one data row, so its Estimate
+    values become the Count column directly — no subset/relabel/transpose.
     """
-    # Keep only Estimate columns (ending in 'E'), drop annotations/margins
-    estimate_cols = [c for c in df_raw.columns
-                     if c.startswith("B15011_") and c.endswith("E")]
+    # Keep only Estimate columns (<table>_<nnn>E), drop annotations/margins
+    estimates = df_raw.filter(regex=rf"^{table_id}_\d+E$")
 
-    df = df_raw[estimate_cols].copy()
+    # Human-readable labels, without the "Estimate!!" prefix
+    names = [labels[c].replace("Estimate!!", "").strip()
+             if c in labels else c for c in estimates.columns]
 
-    # Rename columns to human-readable labels
-    rename_map = {}
-    for col in estimate_cols:
-        if col in labels:
-            # Clean the label: remove "Estimate!!" prefix
-            clean = labels[col].replace("Estimate!!", "").strip()
-            rename_map[col] = clean
-        else:
-            rename_map[col] = col
-    df = df.rename(columns=rename_map)
+    # Convert to numeric (non-numeric → NaN) in a single pass
+    counts = pd.to_numeric(estimates.iloc[0].to_numpy(), errors="coerce")
 
-    # Convert to numeric
-    for col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+    return pd.DataFrame({label_col: names, "Count": counts})
 
-    # Transpose so fields are rows for easier reading
-    df_t = df.T
-    df_t.columns = ["Count"]
-    df_t.index.name = "Field_of_Degree"
-    df_t = df_t.reset_index()
 
-    return df_t
+def process_b15011(df_raw, labels):
+    """
+    Process B15011 (Field of Bachelor's Degree).
+    Extract Estimate columns only, map to human-readable labels,
+    and create a clean summary of degree fields.
+    """
+    return estimate_table(df_raw, labels, "B15011", "Field_of_Degree")
 
 
 def process_c24030(df_raw, labels):
@@ -186,33 +202,7 @@ def process_c24030(df_raw, labels):
     Extract Estimate columns only, map to human-readable labels,
     and create a clean summary of industry employment.
     """
-    # Keep only Estimate columns
-    estimate_cols = [c for c in df_raw.columns
-                     if c.startswith("C24030_") and c.endswith("E")]
-
-    df = df_raw[estimate_cols].copy()
-
-    # Rename columns to human-readable labels
-    rename_map = {}
-    for col in estimate_cols:
-        if col in labels:
-            clean = labels[col].replace("Estimate!!", "").strip()
-            rename_map[col] = clean
-        else:
-            rename_map[col] = col
-    df = df.rename(columns=rename_map)
-
-    # Convert to numeric
-    for col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    # Transpose
-    df_t = df.T
-    df_t.columns = ["Count"]
-    df_t.index.name = "Industry_Category"
-    df_t = df_t.reset_index()
-
-    return df_t
+    return estimate_table(df_raw, labels, "C24030", "Industry_Category")
 
 
 def compute_degree_mismatch(df_degree, df_industry):
@@ -255,45 +245,58 @@ def main():
 
     data_year = None
     raw_tables = {}
+    labels = {}
+    label_counts = {}
 
     # ── Try each year until we find available data ───────────────────────
+    # The tables and their label groups are independent requests, so all
+    # four for a year are issued at once (backoff stays in each fetcher)
     for year in YEARS_TO_TRY:
         print(f"\n▸ Trying ACS 1-Year {year}...")
-        success = True
-
         for table_id, info in TABLES.items():
             print(f"\n  Table: {table_id} — {info['title']}")
             print(f"  Purpose: {info['purpose']}")
-            df = fetch_acs_table(table_id, year)
-
-            if df is None:
-                success = False
-                print(f"  ⚠ {table_id} not available for {year}. "
-                      f"Trying next year...")
-                break
 
-            raw_tables[table_id] = df
-            time.sleep(1)  # Polite delay
-
-        if success:
-            data_year = year
-            print(f"\n✓ Successfully fetched all tables for ACS {year}.")
-            break
+        # Worker threads buffer their progress lines instead of printing
+        # them interleaved; each table's lines are printed as one block
+        logs = {table_id: [] for table_id in TABLES}
+        with ThreadPoolExecutor(max_workers=2 * len(TABLES)) as executor:
+            table_futures = {table_id: executor.submit(
+                fetch_acs_table, table_id, year, log=logs[table_id].append)
+                for table_id in TABLES}
+            label_futures = {table_id: executor.submit(
+                fetch_variable_labels, table_id, year,
+                log=logs[table_id].append)
+                for table_id in TABLES}
+            year_tables = {t: f.result() for t, f in table_futures.items()}
+            year_labels = {t: f.result() for t, f in label_futures.items()}
+        print("\n" + "\n".join(line for lines in logs.values()
+                               for line in lines))
+
+        missing = [t for t, df in year_tables.items() if df is None]
+        if missing:
+            print(f"  ⚠ {', '.join(missing)} not available for {year}. "
+                  f"Trying next year...")
+            continue
+
+        raw_tables = year_tables
+        for table_id, tbl_labels in year_labels.items():
+            labels.update(tbl_labels)
+            label_counts[table_id] = len(tbl_labels)
+        data_year = year
+        print(f"\n✓ Successfully fetched all tables for ACS {year}.")
+        break
 
     if data_year is None:
         print("\n✗ ERROR: Could not fetch Census data for any year.")
         print("  Tried years:", YEARS_TO_TRY)
         sys.exit(1)
 
-    # ── Fetch variable labels for human-readable column names ────────────
+    # ── Variable labels for human-readable column names ──────────────────
     print("\n" + "-" * 72)
-    print("Fetching variable labels...")
-    labels = {}
-    for table_id in TABLES:
-        tbl_labels = fetch_variable_labels(table_id, data_year)
-        labels.update(tbl_labels)
-        print(f"  ✓ {table_id}: {len(tbl_labels)} variable labels loaded.")
-        time.sleep(0.5)
+    print("Variable labels (fetched alongside the tables, or cached):")
+    for table_id, n_labels in label_counts.items():
+        print(f"  ✓ {table_id}: {n_labels} variable labels loaded.")
 
     # ── Process each table ───────────────────────────────────────────────
     print("\n" + "-" * 72)
@@ -325,7 +328,8 @@ def main():
 
     # ── Save ─────────────────────────────────────────────────────────────
     os.makedirs(OUTPUT_DIR, exist_ok=True)
-    df_mismatch.to_csv(OUTPUT_FILE, index=False)
+    pcsv.write_csv(pa.Table.from_pandas(df_mismatch, preserve_index=False),
+                   OUTPUT_FILE)  # Arrow's C++ writer; strings are quoted
     file_size_kb = os.path.getsize(OUTPUT_FILE) / 1024
     print(f"\n✅ Saved to {OUTPUT_FILE} ({file_size_kb:.1f} KB)")
 
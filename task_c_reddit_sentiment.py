@@ -14,17 +14,25 @@ Purpose : Constructs a "Sentiment Index" by scraping employment-distress
           using Reddit's OAuth2 JSON API. To avoid Reddit's recency bias
           (which returns mostly 2024-2025 results when querying "all"),
           we iterate YEAR-BY-YEAR using CloudSearch timestamp syntax:
-              query = "layoff timestamp:1577836800..1609459200"
+              query = "(layoff OR ...) timestamp:1577836800..1609459200"
           This forces Reddit to return the top posts for each specific
           year, producing a time-balanced dataset across 2020-2026.
 
-          For each year × subreddit × search term, we pull up to 100
-          posts, then deduplicate globally. The progress bar shows LIVE
-          post counts and a checkpoint CSV is saved every 50 queries.
+          For each year × subreddit, all search terms are OR-grouped into
+          one query, then posts are deduplicated globally. Each query pages
+          up to QUERY_LIMIT (1000) posts, but Reddit search's own result
+          cap usually ends pagination well before that. The progress bar
+          shows LIVE post counts and a checkpoint is saved every 5 queries.
+
+          search_term is therefore NOT the query that returned a post: it
+          is assigned afterwards as the term whose case-insensitive match
+          starts earliest in title + selftext (ties → earlier SEARCH_TERMS
+          entry), or "other" when Reddit's stemming matched a post that
+          contains none of the terms literally.
 
 Output  : data/df_reddit_sentiment.csv (primary)
-          data/df_reddit_sentiment.parquet (gzip backup)
-          data/temp_reddit_checkpoint.csv (incremental, deleted on success)
+          data/df_reddit_sentiment.parquet (zstd backup)
+          data/temp_reddit_checkpoint.parquet (incremental, deleted on success)
 =============================================================================
 """
 
@@ -34,8 +42,15 @@ import sys
 import time
 import json
 import datetime
+import threading
+from itertools import compress
+from concurrent.futures import ThreadPoolExecutor
 import requests
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pcsv
+import pyarrow.parquet as pq
 from tqdm import tqdm
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -77,6 +92,17 @@ SEARCH_TERMS = [
     "cost of living",           # economic pressure even for employed workers
 ]
 
+# All terms go out as one boolean query per (year, subreddit) — each grouped
+# query costs one request per page instead of one request per term. Posts
+# are tagged with the first term found in their title/body after scraping.
+GROUPED_QUERY = "(" + " OR ".join(
+    f'"{t}"' if " " in t else t for t in SEARCH_TERMS
+) + ")"
+TERM_PATTERN = re.compile(
+    "(" + "|".join(re.escape(t) for t in SEARCH_TERMS) + ")", re.IGNORECASE
+)
+UNMATCHED_TERM = "other"  # Matched by Reddit's stemming, not a literal term
+
 # Date range: Jan 2020 – Jan 2026 (as Unix timestamps for filtering)
 START_DATE = datetime.datetime(2020, 1, 1)
 END_DATE   = datetime.datetime(2026, 2, 1)  # exclusive upper bound
@@ -87,17 +113,51 @@ END_TS     = int(END_DATE.timestamp())
 # Without this, Reddit's API returns mostly 2024-2025 content
 YEARS = list(range(2020, 2027))  # 2020, 2021, ..., 2026
 
+# Grouped query per year, built once: the CloudSearch timestamp clause
+# forces year-specific results (2026 is capped at END_TS, i.e. Feb 1)
+YEAR_QUERIES = {
+    year: f"{GROUPED_QUERY} timestamp:"
+          f"{int(datetime.datetime(year, 1, 1).timestamp())}.."
+          f"{min(int(datetime.datetime(year + 1, 1, 1).timestamp()), END_TS)}"
+    for year in YEARS
+}
+
 # Output configuration
 OUTPUT_DIR  = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 OUTPUT_CSV  = os.path.join(OUTPUT_DIR, "df_reddit_sentiment.csv")
 OUTPUT_PQ   = os.path.join(OUTPUT_DIR, "df_reddit_sentiment.parquet")
-CHECKPOINT  = os.path.join(OUTPUT_DIR, "temp_reddit_checkpoint.csv")
+CHECKPOINT  = os.path.join(OUTPUT_DIR, "temp_reddit_checkpoint.parquet")
+CACHE_DIR   = os.path.join(OUTPUT_DIR, ".cache")
+TOKEN_CACHE = os.path.join(CACHE_DIR, "reddit_token.json")
+
+# With this flag, posts already in OUTPUT_PQ are kept and only the
+# (year, subreddit) queries with no posts there yet are re-run
+USE_CACHED_FLAG = "--use-cached-queries"
+
+# Output schema — posts are accumulated column-wise (one list per field)
+POST_SCHEMA = pa.schema([
+    ("post_id",     pa.string()),
+    ("title",       pa.string()),
+    ("selftext",    pa.string()),
+    ("subreddit",   pa.string()),
+    ("created_utc", pa.int64()),   # Epoch seconds; converted after scraping
+    ("score",       pa.int64()),
+])
 
 # Rate limiting — Reddit allows 60 requests/min for OAuth
-REQUEST_DELAY = 1.0
+REQUEST_DELAY = 1.0   # Request spacing when no rate-limit headers (seconds)
+MAX_IN_FLIGHT = 8     # Concurrent queries; overlaps RTT under the rate cap
 MAX_RETRIES   = 3
 BACKOFF_FACTOR = 2
-CHECKPOINT_EVERY = 50  # Save checkpoint every N queries
+QUERY_LIMIT   = 1000  # Page cap per grouped query (10 × 100); Reddit
+                      # search's own result cap usually ends it sooner
+CHECKPOINT_EVERY = 5   # Save checkpoint every N queries
+
+# One pooled session for the whole run (auth, verify and every search page),
+# so TLS handshakes are paid once per connection rather than per request
+SESSION = requests.Session()
+SESSION.mount("https://", requests.adapters.HTTPAdapter(
+    pool_maxsize=MAX_IN_FLIGHT))
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 2. OAuth2: Get access token
@@ -106,47 +166,117 @@ def get_oauth_token():
     """
     Obtain a Reddit OAuth2 bearer token using client credentials flow.
     This is the standard approach for script-type Reddit apps.
+    The token is cached to TOKEN_CACHE and reused until a minute before it
+    expires, so back-to-back runs skip the OAuth round-trip.
     """
+    try:
+        with open(TOKEN_CACHE, "r") as f:
+            cached = json.load(f)
+        if (cached["client_id"] == REDDIT_CLIENT_ID
+                and cached["expires_at"] - time.time() > 60):
+            return cached["token"]
+    except (OSError, ValueError, KeyError):
+        pass
+
     auth = requests.auth.HTTPBasicAuth(REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET)
     data = {"grant_type": "client_credentials"}
     headers = {"User-Agent": REDDIT_USER_AGENT}
 
-    resp = requests.post(
+    resp = SESSION.post(
         "https://www.reddit.com/api/v1/access_token",
         auth=auth, data=data, headers=headers, timeout=15,
     )
     resp.raise_for_status()
     token_data = resp.json()
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(TOKEN_CACHE, "w") as f:
+        json.dump({
+            "client_id": REDDIT_CLIENT_ID,
+            "token": token_data["access_token"],
+            "expires_at": time.time() + token_data.get("expires_in", 3600),
+        }, f)
     return token_data["access_token"]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 3. HELPER: Clean text (remove URLs, excess whitespace)
 # ─────────────────────────────────────────────────────────────────────────────
-URL_PATTERN = re.compile(
-    r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|"
-    r"(?:%[0-9a-fA-F][0-9a-fA-F]))+"
-)
+# One pass: a run of URLs (with the whitespace around them) or any other
+# whitespace run (spaces, newlines, tabs) collapses to a single space
+CLEAN_PATTERN = re.compile(r"(?:\s*https?://\S+)+\s*|\s+")
+# Placeholders Reddit leaves behind for removed content (hashed lookup)
+REMOVED_MARKERS = frozenset({"[deleted]", "[removed]"})
 
 def clean_text(text):
     """Remove URLs, newlines, and extra whitespace."""
-    if not text or text in ("[deleted]", "[removed]"):
+    if not text or text in REMOVED_MARKERS:
         return ""
-    text = URL_PATTERN.sub("", text)
-    text = text.replace("\n", " ").replace("\r", " ").replace("\t", " ")
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    return CLEAN_PATTERN.sub(" ", text).strip()
+
+
+def post_id_key(pid):
+    """
+    Dedup key for a Reddit post ID. IDs are base-36 strings, so the int value
+    is an exact, collision-free key that is smaller than the string and
+    cheaper to hash; anything non-base-36 falls back to the string itself.
+    """
+    try:
+        return int(pid, 36)
+    except ValueError:
+        return pid
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 4. HELPER: Search with retry and pagination
 # ─────────────────────────────────────────────────────────────────────────────
+_rate_lock = threading.Lock()
+_next_slot = 0.0  # time.monotonic() at which the next request may go out
+_request_spacing = REQUEST_DELAY  # Adapted from Reddit's rate-limit headers
+
+
+def wait_for_request_slot():
+    """
+    Block until the global rate limiter allows another request. Dispatches
+    are spaced _request_spacing apart across all threads, so concurrent
+    queries overlap their network round-trips without exceeding the quota.
+    """
+    global _next_slot
+    with _rate_lock:
+        now = time.monotonic()
+        if _next_slot > now:
+            time.sleep(_next_slot - now)
+            now = _next_slot
+        _next_slot = now + _request_spacing
+
+
+def update_request_spacing(resp_headers):
+    """
+    Spread the remaining quota evenly over the current window: space requests
+    X-Ratelimit-Reset / X-Ratelimit-Remaining seconds apart. Falls back to
+    REQUEST_DELAY when Reddit omits (or mangles) the headers.
+    """
+    global _request_spacing
+    try:
+        remaining = float(resp_headers["X-Ratelimit-Remaining"])
+        reset_s = float(resp_headers["X-Ratelimit-Reset"])
+        spacing = reset_s / max(remaining, 1)
+    except (KeyError, ValueError):
+        spacing = REQUEST_DELAY
+    _request_spacing = spacing  # Atomic rebind; read at the next dispatch
+
+
 def search_subreddit(subreddit, query, headers, sort="relevance",
-                     limit=100, time_filter="all"):
+                     limit=100, time_filter="all", session=None):
     """
     Search a subreddit using Reddit's OAuth2 JSON API.
-    Returns a list of post dicts. Handles pagination via 'after'.
+    Returns a list of (id, title, selftext, subreddit, created_utc, score)
+    tuples — only the fields main() keeps, so the ~100-key post dicts are
+    dropped page by page. Handles pagination via 'after'.
+    Every page request goes through wait_for_request_slot(); pass a shared
+    requests.Session to reuse connections across threads.
     """
+    http = session or requests
     url = f"https://oauth.reddit.com/r/{subreddit}/search"
     params = {
         "q": query,
@@ -165,9 +295,11 @@ def search_subreddit(subreddit, query, headers, sort="relevance",
 
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                resp = requests.get(
+                wait_for_request_slot()
+                resp = http.get(
                     url, headers=headers, params=params, timeout=15,
                 )
+                update_request_spacing(resp.headers)
                 if resp.status_code == 429:
                     wait = BACKOFF_FACTOR ** attempt
                     time.sleep(wait)
@@ -186,15 +318,17 @@ def search_subreddit(subreddit, query, headers, sort="relevance",
         if not children:
             break
 
-        for child in children:
-            all_posts.append(child["data"])
+        all_posts.extend(
+            (p.get("id", ""), p.get("title", ""), p.get("selftext", ""),
+             p.get("subreddit", subreddit), p.get("created_utc", 0),
+             p.get("score", 0))
+            for p in (child["data"] for child in children)
+        )
 
         after = data.get("after")
         if not after or len(all_posts) >= limit:
             break
 
-        time.sleep(REQUEST_DELAY)
-
     return all_posts[:limit]
 
 
@@ -227,24 +361,55 @@ def main():
     }
 
     # Verify token with a simple call
-    test_resp = requests.get(
+    test_resp = SESSION.get(
         "https://oauth.reddit.com/api/v1/me",
         headers=oauth_headers, timeout=10,
     )
     print(f"  ✓ Token verified (status: {test_resp.status_code})")
 
+    # ── Reuse previous results (optional) ───────────────────────────────
+    posts = {name: [] for name in POST_SCHEMA.names}  # Column-wise storage
+    post_ids = posts["post_id"]
+    done_queries = set()  # (year, lowercased subreddit) pairs already scraped
+    if USE_CACHED_FLAG in sys.argv[1:] and os.path.exists(OUTPUT_PQ):
+        df_prev = pd.read_parquet(OUTPUT_PQ, columns=POST_SCHEMA.names)
+        created = df_prev["created_utc"]
+        df_prev["created_utc"] = (
+            (created - pd.Timestamp("1970-01-01")) // pd.Timedelta(seconds=1)
+        )
+        for name in POST_SCHEMA.names:
+            posts[name].extend(df_prev[name].tolist())
+        # The API reports display names ("Layoffs"), SUBREDDITS holds the
+        # URL names ("layoffs"): compare both sides lowercased
+        wanted = {sub_name.lower() for sub_name in SUBREDDITS}
+        done_queries = {
+            (year, sub) for year, sub in zip(created.dt.year,
+                                             df_prev["subreddit"].str.lower())
+            if year in YEAR_QUERIES and sub in wanted
+        }
+        print(f"\n  ✓ Reusing {len(df_prev):,} cached posts from "
+              f"{len(done_queries)} (year, subreddit) queries")
+
+    # Every (year, subreddit) grouped query, in the original nesting order
+    queries = [(year, sub_name, YEAR_QUERIES[year])
+               for year in YEARS for sub_name in SUBREDDITS
+               if (year, sub_name.lower()) not in done_queries]
+
     # ── Calculate total iterations ───────────────────────────────────────
-    # Now we loop years × subreddits × terms for time-balanced results
-    total_queries = len(YEARS) * len(SUBREDDITS) * len(SEARCH_TERMS)
+    # Now we loop years × subreddits (all terms grouped) for time balance
+    total_queries = len(queries)
     print(f"\n  Total queries: {total_queries} "
-          f"({len(YEARS)} years × {len(SUBREDDITS)} subs × "
-          f"{len(SEARCH_TERMS)} terms)")
-    print(f"  ⏱ Estimated time: ~{total_queries * 1.2 / 60:.0f} minutes\n")
+          f"(of {len(YEARS)} years × {len(SUBREDDITS)} subs, "
+          f"{len(SEARCH_TERMS)} terms OR-grouped)")
+    max_requests = total_queries * (QUERY_LIMIT // 100)  # 100 per page
+    print(f"  ⏱ Estimated time: ≤ ~{max_requests * REQUEST_DELAY / 60:.0f} "
+          f"minutes (rate-limited, {MAX_IN_FLIGHT} queries in flight)\n")
 
     # ── Main scraping loop ───────────────────────────────────────────────
-    all_posts = []
-    seen_ids = set()  # Deduplication across queries
+    seen_ids = set(map(post_id_key, post_ids))  # Dedup (base-36 ID → int)
     query_count = 0
+    checkpoint_writer = None  # Appends only rows added since the last one
+    n_checkpointed = len(post_ids)  # Cached posts are already on disk
 
     pbar = tqdm(
         total=total_queries,
@@ -254,92 +419,92 @@ def main():
                    "[{elapsed}<{remaining}] {postfix}",
     )
 
-    for year in YEARS:
-        # Build CloudSearch timestamp range for this year
-        year_start_ts = int(datetime.datetime(year, 1, 1).timestamp())
-        if year < 2026:
-            year_end_ts = int(datetime.datetime(year + 1, 1, 1).timestamp())
-        else:
-            year_end_ts = END_TS  # 2026 only goes to Feb 1
-        timestamp_clause = f"timestamp:{year_start_ts}..{year_end_ts}"
-
-        for sub_name in SUBREDDITS:
-            for term in SEARCH_TERMS:
-                pbar.set_postfix_str(
-                    f"{year} r/{sub_name} '{term}' | "
-                    f"{len(all_posts)} posts",
-                    refresh=True,
-                )
-
-                # Append timestamp clause to force year-specific results
-                full_query = f"{term} {timestamp_clause}"
-
-                raw_posts = search_subreddit(
-                    sub_name, full_query, oauth_headers,
-                    sort="relevance", limit=100, time_filter="all",
-                )
-
-                # Extract and filter
-                new_this_query = 0
-                for p in raw_posts:
-                    pid = p.get("id", "")
-                    if pid in seen_ids:
-                        continue
-
-                    created_utc = p.get("created_utc", 0)
-                    if created_utc < START_TS or created_utc >= END_TS:
-                        continue
-
-                    seen_ids.add(pid)
-                    new_this_query += 1
-
-                    all_posts.append({
-                        "post_id":     pid,
-                        "title":       clean_text(p.get("title", "")),
-                        "selftext":    clean_text(p.get("selftext", "")),
-                        "subreddit":   p.get("subreddit", sub_name),
-                        "created_utc": datetime.datetime.utcfromtimestamp(
-                            created_utc
-                        ).strftime("%Y-%m-%d %H:%M:%S"),
-                        "score":       p.get("score", 0),
-                        "search_term": term,
-                    })
-
-                query_count += 1
-                pbar.update(1)
-
-                pbar.set_postfix_str(
-                    f"{year} r/{sub_name} '{term}' +{new_this_query} | "
-                    f"TOTAL: {len(all_posts)} posts",
-                    refresh=True,
-                )
+    def run_query(query):
+        _, sub_name, full_query = query
+        return search_subreddit(
+            sub_name, full_query, oauth_headers, sort="relevance",
+            limit=QUERY_LIMIT, time_filter="all", session=SESSION,
+        )
+
+    # Queries run concurrently under the shared rate limiter; map() yields
+    # results in submission order, so dedup keeps the sequential semantics
+    with ThreadPoolExecutor(max_workers=MAX_IN_FLIGHT) as executor:
+        for (year, sub_name, _), raw_posts in zip(
+                queries, executor.map(run_query, queries)):
+
+            # Date-filter the whole result in one vectorized comparison
+            ts = np.fromiter((p[4] for p in raw_posts), dtype=np.float64,
+                             count=len(raw_posts))
+            in_range = (ts >= START_TS) & (ts < END_TS)
+
+            # Extract and deduplicate
+            new_this_query = 0
+            for (pid, title, selftext, subreddit,
+                 created_utc, score) in compress(raw_posts, in_range):
+                id_key = post_id_key(pid)
+                if id_key in seen_ids:
+                    continue
 
-                # ── Checkpoint every N queries ──────────────────────────
-                if query_count % CHECKPOINT_EVERY == 0 and all_posts:
+                seen_ids.add(id_key)
+                new_this_query += 1
+
+                post_ids.append(pid)
+                posts["title"].append(clean_text(title))
+                posts["selftext"].append(clean_text(selftext))
+                posts["subreddit"].append(subreddit)
+                posts["created_utc"].append(int(created_utc))
+                posts["score"].append(score)
+
+            query_count += 1
+            pbar.update(1)
+
+            pbar.set_postfix_str(
+                f"{year} r/{sub_name} +{new_this_query} | "
+                f"TOTAL: {len(post_ids)} posts",
+                refresh=True,
+            )
+
+            # ── Checkpoint every N queries ──────────────────────────────
+            if (query_count % CHECKPOINT_EVERY == 0
+                    and len(post_ids) > n_checkpointed):
+                if checkpoint_writer is None:
                     os.makedirs(OUTPUT_DIR, exist_ok=True)
-                    pd.DataFrame(all_posts).to_csv(CHECKPOINT, index=False)
-
-                # Rate limiting
-                time.sleep(REQUEST_DELAY)
+                    checkpoint_writer = pq.ParquetWriter(CHECKPOINT,
+                                                         POST_SCHEMA)
+                checkpoint_writer.write_table(pa.Table.from_pydict(
+                    {name: col[n_checkpointed:]
+                     for name, col in posts.items()},
+                    schema=POST_SCHEMA,
+                ))
+                n_checkpointed = len(post_ids)
 
     pbar.close()
+    if checkpoint_writer is not None:
+        checkpoint_writer.close()
 
     # ── Build DataFrame ──────────────────────────────────────────────────
     print("\n" + "-" * 72)
     print("Building DataFrame...")
 
-    if not all_posts:
+    if not post_ids:
         print("  ⚠ WARNING: No posts were retrieved.")
-        df = pd.DataFrame(columns=[
-            "post_id", "title", "selftext", "subreddit",
-            "created_utc", "score", "search_term",
-        ])
-    else:
-        df = pd.DataFrame(all_posts)
-
-    # Convert created_utc to datetime
+    df = pd.DataFrame(posts, columns=[*POST_SCHEMA.names, "search_term"])
+
     if len(df) > 0:
-        df["created_utc"] = pd.to_datetime(df["created_utc"])
+        # Tag each post with its search term in one vectorized regex pass
+        df["search_term"] = (
+            df["title"].str.cat(df["selftext"], sep=" ")
+            .str.extract(TERM_PATTERN, expand=False)
+            .str.lower()
+            .fillna(UNMATCHED_TERM)
+        )
+
+        # Convert epoch seconds to (naive, UTC) datetimes in one pass; the
+        # explicit [s] cast pins the unit (pandas < 3 would give [ns], and
+        # Arrow would then write ".000000000" into every CSV timestamp)
+        df["created_utc"] = pd.to_datetime(
+            df["created_utc"], unit="s"
+        ).astype("datetime64[s]")
         df = df.sort_values("created_utc").reset_index(drop=True)
 
     # ── Data Quality Report ──────────────────────────────────────────────
@@ -367,11 +532,16 @@ def main():
     # ── Save as CSV (primary) and Parquet (secondary) ────────────────────
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    df.to_csv(OUTPUT_CSV, index=False)
+    # One Arrow table feeds both writers (multi-threaded C++ formatting);
+    # created_utc was cast to datetime64[s] above, so the CSV keeps
+    # whole-second stamps regardless of the pandas version
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    pcsv.write_csv(table, OUTPUT_CSV)
     csv_kb = os.path.getsize(OUTPUT_CSV) / 1024
     print(f"\n✅ CSV  → {OUTPUT_CSV} ({csv_kb:.1f} KB)")
 
-    df.to_parquet(OUTPUT_PQ, compression="gzip", index=False)
+    pq.write_table(table, OUTPUT_PQ, compression="zstd")
     pq_kb = os.path.getsize(OUTPUT_PQ) / 1024
     print(f"✅ PQ   → {OUTPUT_PQ} ({pq_kb:.1f} KB)")
 